@@ -0,0 +1,12 @@
+from ._retry import RetryPolicy
+from .logo_maker import AsyncLogoMakerClient, LogoMakerClient, decode_image
+from .med_agent import AsyncMedAgentClient, MedAgentClient
+
+__all__ = [
+    "AsyncLogoMakerClient",
+    "AsyncMedAgentClient",
+    "LogoMakerClient",
+    "MedAgentClient",
+    "RetryPolicy",
+    "decode_image",
+]
@@ -0,0 +1,296 @@
+"""
+Connection-pooled sync/async HTTP clients with retries, streaming and bulk sending
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ALL_COMPLETED, FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Mapping, Optional
+
+import httpx
+
+from ._retry import NO_RETRY, RetryPolicy
+
+DEFAULT_TIMEOUT = httpx.Timeout(120.0, connect=10.0)  # agent turns can take a while
+DEFAULT_MAX_CONCURRENCY = 8
+
+# A conversation is an ordered list of keyword arguments for chat(), sent one
+# after another since every turn builds on the same session.
+Conversation = Iterable[Mapping[str, Any]]
+
+
+def _uploads_seekable(files: Optional[Mapping[str, Any]]) -> bool:
+    """
+    Whether every upload can be sent again on a retry. httpx seeks each file
+    back to byte 0 before sending it, so uploads always start at the
+    beginning of the file, whatever its current position.
+    """
+    for value in (files or {}).values():
+        file = value[1] if isinstance(value, tuple) else value
+        try:
+            if not file.seekable():
+                return False
+        except (AttributeError, OSError):
+            return False
+    return True
+
+
+def _limits(max_connections: int, max_keepalive_connections: int) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=30.0,
+    )
+
+
+class BaseClient(ABC):
+    """
+    Synchronous client over a keep-alive connection pool of up to max_connections.
+    Thread-safe, so one instance can be shared across threads.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        *,
+        timeout: Any = DEFAULT_TIMEOUT,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        retry: Optional[RetryPolicy] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.retry = retry if retry is not None else RetryPolicy()
+        self._client = httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            limits=_limits(max_connections, max_keepalive_connections),
+            headers=headers,
+            transport=transport,
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _send(self, method: str, path: str, *, files: Optional[Mapping[str, Any]] = None, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying per the retry policy.
+        Returns the response with its body not yet read; the caller must close it.
+        """
+        retry = self.retry if _uploads_seekable(files) else NO_RETRY
+        attempt = 0
+        while True:
+            request = self._client.build_request(method, path, files=files, **kwargs)
+            try:
+                response = self._client.send(request, stream=True)
+            except httpx.TransportError as error:
+                if not retry.should_retry(attempt, error=error):
+                    raise
+                time.sleep(retry.delay(attempt))
+                attempt += 1
+                continue
+
+            if not retry.should_retry(attempt, response):
+                return response
+            delay = retry.delay(attempt, response)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        response = self._send(method, path, **kwargs)
+        try:
+            response.read()
+        finally:
+            response.close()
+        response.raise_for_status()
+        return response
+
+    @contextmanager
+    def _stream(self, method: str, path: str, **kwargs) -> Iterator[httpx.Response]:
+        response = self._send(method, path, **kwargs)
+        try:
+            if response.is_error:
+                response.read()
+                response.raise_for_status()
+            yield response
+        finally:
+            response.close()
+
+    @abstractmethod
+    def chat(self, **kwargs) -> Any:
+        """
+        Send one turn of a conversation.
+        """
+
+    def chat_many(
+        self,
+        conversations: Iterable[Conversation],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Send many conversations concurrently, at most max_concurrency at a time.
+        Turns within a conversation are sent in order.
+        Returns one list of chat() results per conversation, in input order.
+        With return_exceptions=True a failed conversation yields its exception instead;
+        otherwise the first failure is raised and conversations not yet started are cancelled.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        def run(conversation: List[Mapping[str, Any]]) -> List[Any]:
+            return [self.chat(**turn) for turn in conversation]
+
+        pool = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            futures = [pool.submit(run, list(conversation)) for conversation in conversations]
+            wait(futures, return_when=ALL_COMPLETED if return_exceptions else FIRST_EXCEPTION)
+            if not return_exceptions:
+                for future in futures:
+                    if future.done() and not future.cancelled() and future.exception() is not None:
+                        raise future.exception()
+        finally:
+            # Conversations that haven't started yet are dropped after a failure
+            pool.shutdown(cancel_futures=True)
+
+        return [future.exception() or future.result() for future in futures]
+
+
+class AsyncBaseClient(ABC):
+    """
+    Asynchronous client over a keep-alive connection pool of up to max_connections.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        *,
+        timeout: Any = DEFAULT_TIMEOUT,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        retry: Optional[RetryPolicy] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.retry = retry if retry is not None else RetryPolicy()
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=_limits(max_connections, max_keepalive_connections),
+            headers=headers,
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _send(
+        self, method: str, path: str, *, files: Optional[Mapping[str, Any]] = None, **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request, retrying per the retry policy.
+        Returns the response with its body not yet read; the caller must close it.
+        """
+        retry = self.retry if _uploads_seekable(files) else NO_RETRY
+        attempt = 0
+        while True:
+            request = self._client.build_request(method, path, files=files, **kwargs)
+            try:
+                response = await self._client.send(request, stream=True)
+            except httpx.TransportError as error:
+                if not retry.should_retry(attempt, error=error):
+                    raise
+                await asyncio.sleep(retry.delay(attempt))
+                attempt += 1
+                continue
+
+            if not retry.should_retry(attempt, response):
+                return response
+            delay = retry.delay(attempt, response)
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        response = await self._send(method, path, **kwargs)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        response.raise_for_status()
+        return response
+
+    @asynccontextmanager
+    async def _stream(self, method: str, path: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        response = await self._send(method, path, **kwargs)
+        try:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            yield response
+        finally:
+            await response.aclose()
+
+    @abstractmethod
+    async def chat(self, **kwargs) -> Any:
+        """
+        Send one turn of a conversation.
+        """
+
+    async def chat_many(
+        self,
+        conversations: Iterable[Conversation],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Send many conversations concurrently, at most max_concurrency at a time.
+        Turns within a conversation are sent in order.
+        Returns one list of chat() results per conversation, in input order.
+        With return_exceptions=True a failed conversation yields its exception instead;
+        otherwise as soon as a conversation fails its exception is raised and the others are cancelled.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(conversation: List[Mapping[str, Any]]) -> List[Any]:
+            async with semaphore:
+                return [await self.chat(**turn) for turn in conversation]
+
+        tasks = [asyncio.ensure_future(run(list(conversation))) for conversation in conversations]
+        if not tasks:
+            return []
+        if return_exceptions:
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            # Earlier conversations may still be running when a later one fails,
+            # so raise the first failure in input order among the finished tasks
+            for task in tasks:
+                if task in done and not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+            return [task.result() for task in tasks]
+        finally:
+            # Stops the other conversations after a failure (or if we are cancelled)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
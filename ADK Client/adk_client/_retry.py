@@ -0,0 +1,92 @@
+"""
+Retry policy shared by the sync and async clients
+"""
+
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional, Tuple, Type
+
+import httpx
+
+
+# Errors raised while connecting, before the request reached the server, so
+# retrying them never sends a chat turn twice. Errors after the request was
+# sent (read timeouts, RemoteProtocolError on a dropped connection) may mean
+# the agent already ran the turn, so retrying those is opt-in via retry_errors.
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+# 429 and 503 mean the request was turned away without being processed.
+# 502/504 from a gateway may come after the agent ran the turn, so they are
+# opt-in via retry_statuses.
+RETRYABLE_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+    Returns None if the header is missing, malformed or not finite.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        if retry_at.tzinfo is None:
+            # HTTP-dates are always GMT
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = retry_at.timestamp() - time.time()
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How failed requests are retried.
+
+    Delays use exponential backoff with full jitter, capped at backoff_max.
+    A Retry-After header on a retryable response takes precedence, capped at
+    retry_after_max.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_after_max: float = 60.0
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES
+    retry_errors: Tuple[Type[Exception], ...] = RETRYABLE_ERRORS
+
+    def should_retry(
+        self, attempt: int, response: Optional[httpx.Response] = None, error: Optional[Exception] = None
+    ) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            return isinstance(error, self.retry_errors)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.retry_after_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
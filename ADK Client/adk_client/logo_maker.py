@@ -0,0 +1,160 @@
+"""
+Client for the Logo Maker FastAPI server (Logo Maker Tutorial)
+"""
+
+import base64
+import mimetypes
+import os
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterator, Optional, Tuple, Union
+
+import httpx
+
+from ._base import AsyncBaseClient, BaseClient
+
+# An image is either a path to open or an already open binary file handle
+ImageInput = Union[str, "os.PathLike[str]", BinaryIO]
+
+
+def _form(user_message: str, user_id: str, session_id: Optional[str]) -> Dict[str, str]:
+    form = {"user_message": user_message, "user_id": user_id}
+    if session_id is not None:
+        form["session_id"] = session_id
+    return form
+
+
+def _files(
+    stack: ExitStack, image: Optional[ImageInput], content_type: Optional[str]
+) -> Optional[Dict[str, Tuple[str, BinaryIO, str]]]:
+    """
+    Build the multipart image_file field. The file handle is passed through
+    as-is so httpx streams it in chunks instead of loading it into memory.
+    Raises ValueError if content_type isn't given and can't be guessed from
+    the file name, since the server rejects uploads without an image type.
+    """
+    if image is None:
+        return None
+    if isinstance(image, (str, os.PathLike)):
+        file = stack.enter_context(open(image, "rb"))
+    else:
+        file = image
+    name = getattr(file, "name", None)
+    # Handles opened from a file descriptor have an int name
+    filename = os.path.basename(name) if isinstance(name, (str, os.PathLike)) else "image"
+    if content_type is None:
+        content_type = mimetypes.guess_type(filename)[0]
+        if content_type is None:
+            raise ValueError(f"Can't guess the content type of {filename!r}; pass image_content_type")
+    return {"image_file": (filename, file, content_type)}
+
+
+def decode_image(response: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Decode the base64 logo from a /chat response, if one was generated.
+    """
+    image = response.get("image")
+    return base64.b64decode(image) if image else None
+
+
+class LogoMakerClient(BaseClient):
+    """
+    Synchronous client for the Logo Maker /chat endpoint.
+    """
+
+    def chat(
+        self,
+        user_message: str,
+        user_id: str,
+        session_id: Optional[str] = None,
+        image: Optional[ImageInput] = None,
+        image_content_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a message (and optionally an image) to the agent.
+        Returns the response JSON: image (base64), text, session_id and success.
+        """
+        with ExitStack() as stack:
+            response = self._request(
+                "POST",
+                "/chat",
+                data=_form(user_message, user_id, session_id),
+                files=_files(stack, image, image_content_type),
+            )
+        return response.json()
+
+    @contextmanager
+    def stream_chat(
+        self,
+        user_message: str,
+        user_id: str,
+        session_id: Optional[str] = None,
+        image: Optional[ImageInput] = None,
+        image_content_type: Optional[str] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Send a message and yield the open response, for reading the body
+        incrementally with iter_bytes()/iter_text()/iter_lines().
+        """
+        with ExitStack() as stack:
+            with self._stream(
+                "POST",
+                "/chat",
+                data=_form(user_message, user_id, session_id),
+                files=_files(stack, image, image_content_type),
+            ) as response:
+                yield response
+
+    def health(self) -> dict:
+        return self._request("GET", "/health").json()
+
+
+class AsyncLogoMakerClient(AsyncBaseClient):
+    """
+    Asynchronous client for the Logo Maker /chat endpoint.
+    """
+
+    async def chat(
+        self,
+        user_message: str,
+        user_id: str,
+        session_id: Optional[str] = None,
+        image: Optional[ImageInput] = None,
+        image_content_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a message (and optionally an image) to the agent.
+        Returns the response JSON: image (base64), text, session_id and success.
+        """
+        with ExitStack() as stack:
+            response = await self._request(
+                "POST",
+                "/chat",
+                data=_form(user_message, user_id, session_id),
+                files=_files(stack, image, image_content_type),
+            )
+        return response.json()
+
+    @asynccontextmanager
+    async def stream_chat(
+        self,
+        user_message: str,
+        user_id: str,
+        session_id: Optional[str] = None,
+        image: Optional[ImageInput] = None,
+        image_content_type: Optional[str] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Send a message and yield the open response, for reading the body
+        incrementally with aiter_bytes()/aiter_text()/aiter_lines().
+        """
+        with ExitStack() as stack:
+            async with self._stream(
+                "POST",
+                "/chat",
+                data=_form(user_message, user_id, session_id),
+                files=_files(stack, image, image_content_type),
+            ) as response:
+                yield response
+
+    async def health(self) -> dict:
+        return (await self._request("GET", "/health")).json()
@@ -0,0 +1,64 @@
+"""
+Client for the med-agent FastAPI server (ADK Docker Tutorial)
+"""
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+import httpx
+
+from ._base import AsyncBaseClient, BaseClient
+
+
+def _payload(message: str, user_id: str, session_id: str) -> dict:
+    return {"message": message, "user_id": user_id, "session_id": session_id}
+
+
+class MedAgentClient(BaseClient):
+    """
+    Synchronous client for the med-agent /chat endpoint.
+    """
+
+    def chat(self, message: str, user_id: str, session_id: str) -> str:
+        """
+        Send a message to the agent and return its reply text.
+        """
+        response = self._request("POST", "/chat", json=_payload(message, user_id, session_id))
+        return response.json()["response"]
+
+    @contextmanager
+    def stream_chat(self, message: str, user_id: str, session_id: str) -> Iterator[httpx.Response]:
+        """
+        Send a message and yield the open response, for reading the body
+        incrementally with iter_bytes()/iter_text()/iter_lines().
+        """
+        with self._stream("POST", "/chat", json=_payload(message, user_id, session_id)) as response:
+            yield response
+
+    def healthcheck(self) -> dict:
+        return self._request("GET", "/healthcheck").json()
+
+
+class AsyncMedAgentClient(AsyncBaseClient):
+    """
+    Asynchronous client for the med-agent /chat endpoint.
+    """
+
+    async def chat(self, message: str, user_id: str, session_id: str) -> str:
+        """
+        Send a message to the agent and return its reply text.
+        """
+        response = await self._request("POST", "/chat", json=_payload(message, user_id, session_id))
+        return response.json()["response"]
+
+    @asynccontextmanager
+    async def stream_chat(self, message: str, user_id: str, session_id: str) -> AsyncIterator[httpx.Response]:
+        """
+        Send a message and yield the open response, for reading the body
+        incrementally with aiter_bytes()/aiter_text()/aiter_lines().
+        """
+        async with self._stream("POST", "/chat", json=_payload(message, user_id, session_id)) as response:
+            yield response
+
+    async def healthcheck(self) -> dict:
+        return (await self._request("GET", "/healthcheck")).json()
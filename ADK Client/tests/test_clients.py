@@ -0,0 +1,268 @@
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+
+from adk_client import AsyncMedAgentClient, LogoMakerClient, MedAgentClient, RetryPolicy
+from adk_client._base import BaseClient
+
+FAST_RETRY = RetryPolicy(max_retries=2, backoff_base=0)
+
+
+class Server:
+    """
+    Mock /chat server that replies with the queued responses, then echoes messages.
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        message = json.loads(request.read())["message"]
+        if message == "fail":
+            return httpx.Response(400, json={"detail": "bad request"})
+        return httpx.Response(200, json={"response": f"echo: {message}"})
+
+
+class NonSeekable(io.BytesIO):
+    def seekable(self):
+        return False
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr("adk_client._base.time.sleep", calls.append)
+    return calls
+
+
+def med_client(server, **kwargs):
+    return MedAgentClient(transport=httpx.MockTransport(server), **kwargs)
+
+
+def conversations(*messages):
+    return [[{"message": message, "user_id": "u", "session_id": str(i)}] for i, message in enumerate(messages)]
+
+
+def test_retries_up_to_max_retries(sleeps):
+    server = Server(*[httpx.Response(503)] * 3)
+    with med_client(server, retry=FAST_RETRY) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.chat("hi", "u", "s")
+    assert len(server.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_honours_retry_after(sleeps):
+    server = Server(httpx.Response(429, headers={"Retry-After": "7"}))
+    with med_client(server, retry=FAST_RETRY) as client:
+        assert client.chat("hi", "u", "s") == "echo: hi"
+    assert sleeps == [7.0]
+
+
+def test_does_not_retry_gateway_errors_by_default(sleeps):
+    server = Server(httpx.Response(504))
+    with med_client(server, retry=FAST_RETRY) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.chat("hi", "u", "s")
+    assert len(server.requests) == 1
+
+
+def test_retries_connect_errors(sleeps):
+    server = Server(httpx.ConnectError("refused"))
+    with med_client(server, retry=FAST_RETRY) as client:
+        assert client.chat("hi", "u", "s") == "echo: hi"
+    assert len(server.requests) == 2
+
+
+def test_does_not_retry_read_timeout(sleeps):
+    server = Server(httpx.ReadTimeout("timed out"))
+    with med_client(server, retry=FAST_RETRY) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            client.chat("hi", "u", "s")
+    assert len(server.requests) == 1
+
+
+def logo_server(*responses):
+    queued = list(responses)
+    requests = []
+
+    def handler(request):
+        request.read()
+        requests.append(request)
+        if queued:
+            return queued.pop(0)
+        return httpx.Response(200, json={"image": "", "text": "ok", "session_id": "s", "success": True})
+
+    return handler, requests
+
+
+def test_upload_is_retried_from_the_start(sleeps):
+    handler, requests = logo_server(httpx.Response(503))
+    image = io.BytesIO(b"PNGDATA")
+    with LogoMakerClient(transport=httpx.MockTransport(handler), retry=FAST_RETRY) as client:
+        client.chat("logo", "u", "s", image=image, image_content_type="image/png")
+    assert len(requests) == 2
+    assert all(b"PNGDATA" in request.content for request in requests)
+
+
+def test_non_seekable_upload_is_not_retried(sleeps):
+    handler, requests = logo_server(httpx.Response(503))
+    with LogoMakerClient(transport=httpx.MockTransport(handler), retry=FAST_RETRY) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.chat("logo", "u", "s", image=NonSeekable(b"PNGDATA"), image_content_type="image/png")
+    assert len(requests) == 1
+
+
+def test_upload_content_type():
+    handler, requests = logo_server()
+    with LogoMakerClient(transport=httpx.MockTransport(handler)) as client:
+        image = io.BytesIO(b"PNGDATA")
+        image.name = "logo.png"
+        client.chat("logo", "u", "s", image=image)
+        with pytest.raises(ValueError):
+            client.chat("logo", "u", "s", image=io.BytesIO(b"PNGDATA"))
+    assert b'filename="logo.png"' in requests[0].content
+    assert b"Content-Type: image/png" in requests[0].content
+    assert len(requests) == 1
+
+
+def test_stream_chat_yields_body():
+    with med_client(Server()) as client:
+        with client.stream_chat("hi", "u", "s") as response:
+            assert b"".join(response.iter_bytes()) == b'{"response":"echo: hi"}'
+
+
+def test_stream_chat_raises_on_error_status():
+    with med_client(Server(httpx.Response(500, text="boom"))) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            with client.stream_chat("hi", "u", "s"):
+                pass
+
+
+def test_chat_many_keeps_input_order():
+    with med_client(Server()) as client:
+        results = client.chat_many(conversations(*"abcdef"), max_concurrency=3)
+    assert results == [[f"echo: {message}"] for message in "abcdef"]
+
+
+def test_chat_many_return_exceptions():
+    with med_client(Server()) as client:
+        results = client.chat_many(conversations("a", "fail", "c"), return_exceptions=True)
+        assert results[0] == ["echo: a"]
+        assert isinstance(results[1], httpx.HTTPStatusError)
+        assert results[2] == ["echo: c"]
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.chat_many(conversations("a", "fail", "c"))
+
+
+def test_chat_many_rejects_zero_concurrency():
+    with med_client(Server()) as client:
+        with pytest.raises(ValueError):
+            client.chat_many(conversations("a"), max_concurrency=0)
+
+
+def test_base_client_requires_chat():
+    class NoChat(BaseClient):
+        pass
+
+    with pytest.raises(TypeError):
+        NoChat()
+
+
+def async_med_client(server, **kwargs):
+    return AsyncMedAgentClient(transport=httpx.MockTransport(server), **kwargs)
+
+
+def test_async_chat_many_keeps_input_order():
+    async def main():
+        async with async_med_client(Server()) as client:
+            return await client.chat_many(conversations(*"abcdef"), max_concurrency=2)
+
+    assert asyncio.run(main()) == [[f"echo: {message}"] for message in "abcdef"]
+
+
+def test_async_chat_many_return_exceptions():
+    async def main():
+        async with async_med_client(Server()) as client:
+            results = await client.chat_many(conversations("a", "fail", "c"), return_exceptions=True)
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.chat_many(conversations("a", "fail", "c"))
+            return results
+
+    results = asyncio.run(main())
+    assert results[0] == ["echo: a"]
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    assert results[2] == ["echo: c"]
+
+
+def test_async_chat_many_cancels_remaining_conversations():
+    started, finished = [], []
+
+    class SlowClient(AsyncMedAgentClient):
+        async def chat(self, message, user_id, session_id):
+            started.append(message)
+            if message == "fail":
+                raise RuntimeError("boom")
+            await asyncio.sleep(10)
+            finished.append(message)
+
+    async def main():
+        async with SlowClient(transport=httpx.MockTransport(Server())) as client:
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(client.chat_many(conversations("fail", "b", "c"), max_concurrency=1), 5)
+
+    asyncio.run(main())
+    assert "c" not in started
+    assert finished == []
+
+
+def test_async_chat_many_raises_later_failure_while_earlier_is_running():
+    finished = []
+
+    class SlowClient(AsyncMedAgentClient):
+        async def chat(self, message, user_id, session_id):
+            if message == "fail":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.5)
+            finished.append(message)
+
+    async def main():
+        async with SlowClient(transport=httpx.MockTransport(Server())) as client:
+            with pytest.raises(RuntimeError, match="boom"):
+                await client.chat_many(conversations("slow", "fail"), max_concurrency=2)
+
+    asyncio.run(main())
+    assert finished == []
+
+
+def test_async_chat_many_rejects_zero_concurrency():
+    async def main():
+        async with async_med_client(Server()) as client:
+            await client.chat_many(conversations("a"), max_concurrency=0)
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+
+
+def test_async_retries_and_stream_errors():
+    async def main():
+        server = Server(httpx.Response(503), httpx.Response(500))
+        async with async_med_client(server, retry=FAST_RETRY) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                async with client.stream_chat("hi", "u", "s"):
+                    pass
+            assert await client.chat("hi", "u", "s") == "echo: hi"
+        return server
+
+    assert len(asyncio.run(main()).requests) == 3
@@ -0,0 +1,53 @@
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from adk_client import RetryPolicy
+from adk_client._retry import parse_retry_after
+
+
+@pytest.mark.parametrize("value", [None, "", "soon", "inf", "-inf", "nan"])
+def test_parse_retry_after_rejects_invalid(value):
+    assert parse_retry_after(value) is None
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-3") == 0.0
+
+
+def test_parse_retry_after_http_date():
+    value = formatdate(time.time() + 30, usegmt=True)
+    assert 25 < parse_retry_after(value) <= 30
+
+
+def test_parse_retry_after_naive_http_date_is_utc():
+    # "-0000" parses to a naive datetime, which must not be read as local time
+    value = formatdate(time.time() + 30)[:-5] + "-0000"
+    assert 25 < parse_retry_after(value) <= 30
+
+
+def test_delay_caps_retry_after():
+    policy = RetryPolicy(retry_after_max=5.0)
+    response = httpx.Response(429, headers={"Retry-After": "1e9"})
+    assert policy.delay(0, response) == 5.0
+
+
+def test_delay_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+    assert all(0 <= policy.delay(attempt) <= 4.0 for attempt in range(10))
+
+
+def test_should_retry_defaults():
+    policy = RetryPolicy(max_retries=1)
+    request = httpx.Request("POST", "http://test/chat")
+    assert policy.should_retry(0, httpx.Response(429))
+    assert policy.should_retry(0, httpx.Response(503))
+    assert not policy.should_retry(0, httpx.Response(502))
+    assert not policy.should_retry(0, httpx.Response(504))
+    assert not policy.should_retry(1, httpx.Response(503))
+    assert policy.should_retry(0, error=httpx.ConnectError("refused", request=request))
+    assert not policy.should_retry(0, error=httpx.ReadTimeout("timed out", request=request))
+    assert not policy.should_retry(0, error=httpx.RemoteProtocolError("disconnected", request=request))